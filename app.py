@@ -1,3 +1,4 @@
+import json
 import os
 import uuid
 from typing import Any
@@ -8,8 +9,10 @@ from prometheus_client import Counter, generate_latest
 
 from langchain_core.messages import HumanMessage
 
+from flipkart.config import Config
 from flipkart.data_ingestion import DataIngestor
 from flipkart.rag_agent import RAGAgentBuilder
+from flipkart.thread_registry import ThreadRegistry
 from utils.logger import get_logger
 from utils.custom_exception import CustomException
 
@@ -55,6 +58,13 @@ def create_app() -> Flask:
         rag_agent = RAGAgentBuilder(vector_store).build_agent()
         logger.info("RAG agent built successfully")
 
+        # Bound the per-client memory threads held by the shared agent
+        thread_registry = ThreadRegistry(
+            rag_agent.checkpointer,
+            max_threads=Config.MAX_CHAT_THREADS,
+            ttl_seconds=Config.CHAT_THREAD_TTL_SECONDS,
+        )
+
         @app.route("/")
         def index() -> str:
             try:
@@ -113,6 +123,108 @@ def create_app() -> Flask:
                 logger.error(f"Error processing /get request: {str(e)}")
                 raise CustomException("Failed to process user query", e)
 
+        @app.route("/stream", methods=["POST"])
+        def stream_response() -> Response:
+            try:
+                logger.info("Processing /stream request")
+                REQUEST_COUNT.inc()
+
+                payload: dict = request.get_json(silent=True) or {}
+                user_input: str = str(payload.get("msg", "")).strip()
+
+                # Each client session keeps its own LangGraph memory thread
+                session_thread_id: str = str(payload.get("thread_id", ""))
+                if not ThreadRegistry.is_valid(session_thread_id):
+                    logger.warning(f"Invalid thread_id received on /stream: {session_thread_id[:50]}")
+                    return jsonify({"error": "thread_id must be a UUID"}), 400
+
+                if not user_input:
+                    logger.warning("Empty user input received on /stream")
+                    return Response(
+                        json.dumps({"delta": "Please enter a message so I can help you."}) + "\n",
+                        mimetype="application/x-ndjson",
+                    )
+
+                thread_registry.touch(session_thread_id)
+
+                logger.info(
+                    f"Streaming RAG agent response for thread {session_thread_id} "
+                    f"with query: {user_input[:50]}..."
+                )
+
+                # NDJSON events: {"delta": text} appends to the reply and
+                # {"reset": true} discards text sent for a model step that
+                # turned out to be a tool call, so the reply ends up as the
+                # final assistant message, same as /get
+                def generate():
+                    try:
+                        current_step = None
+                        step_chars = 0
+                        tool_step = False
+                        for chunk, metadata in rag_agent.stream(
+                            {
+                                "messages": [
+                                    {
+                                        "role": "user",
+                                        "content": user_input,
+                                    }
+                                ]
+                            },
+                            config={
+                                "configurable": {
+                                    "thread_id": session_thread_id,
+                                }
+                            },
+                            stream_mode="messages",
+                        ):
+                            # Only forward tokens of the answering model, not
+                            # tool output or summarization calls
+                            if metadata.get("langgraph_node") != "model":
+                                continue
+
+                            step = metadata.get("langgraph_step")
+                            if step != current_step:
+                                # A new model step means the previous one
+                                # called a tool and was not the final answer
+                                if step_chars:
+                                    yield json.dumps({"reset": True}) + "\n"
+                                current_step = step
+                                step_chars = 0
+                                tool_step = False
+
+                            if tool_step:
+                                continue
+                            if getattr(chunk, "tool_call_chunks", None):
+                                tool_step = True
+                                if step_chars:
+                                    yield json.dumps({"reset": True}) + "\n"
+                                    step_chars = 0
+                                continue
+
+                            if isinstance(chunk.content, str) and chunk.content:
+                                step_chars += len(chunk.content)
+                                yield json.dumps({"delta": chunk.content}) + "\n"
+
+                        PREDICTION_COUNT.inc()
+                        if not step_chars:
+                            logger.warning("No content streamed from agent")
+                            yield json.dumps(
+                                {"delta": "Sorry, I couldn't find relevant product information."}
+                            ) + "\n"
+                        logger.info(f"RAG response streamed: {step_chars} chars")
+                    except Exception as e:
+                        logger.error(f"Error while streaming RAG response: {str(e)}")
+                        raise CustomException("Failed to stream RAG response", e)
+
+                return Response(
+                    generate(),
+                    mimetype="application/x-ndjson",
+                    headers={"X-Accel-Buffering": "no"},
+                )
+            except Exception as e:
+                logger.error(f"Error processing /stream request: {str(e)}")
+                raise CustomException("Failed to process streaming query", e)
+
         @app.route("/health")
         def health() -> tuple[dict, int]:
             try:
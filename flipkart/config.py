@@ -27,6 +27,17 @@ class Config:
         GROQ_API_KEY = os.getenv("GROQ_API_KEY")
         EMBEDDING_MODEL = "BAAI/bge-base-en-v1.5"
         RAG_MODEL = "groq:qwen/qwen3-32b"
+
+        # Streamlit client mode: when set, the UI talks to the Flask API
+        # instead of running the agent in-process
+        CHATBOT_API_URL = os.getenv("CHATBOT_API_URL")
+        CHATBOT_API_TIMEOUT = float(os.getenv("CHATBOT_API_TIMEOUT", "120"))
+        CHATBOT_API_POOL_SIZE = int(os.getenv("CHATBOT_API_POOL_SIZE", "10"))
+        MAX_HISTORY_MESSAGES = int(os.getenv("MAX_HISTORY_MESSAGES", "20"))
+
+        # Bounds on per-client LangGraph memory threads held by the API
+        MAX_CHAT_THREADS = int(os.getenv("MAX_CHAT_THREADS", "1000"))
+        CHAT_THREAD_TTL_SECONDS = float(os.getenv("CHAT_THREAD_TTL_SECONDS", "3600"))
         
         # Validation logging
         logger.info("HF_TOKEN: present")
@@ -36,6 +47,10 @@ class Config:
         logger.info("GROQ_API_KEY: present")
         logger.info(f"EMBEDDING_MODEL: {EMBEDDING_MODEL}")
         logger.info(f"RAG_MODEL: {RAG_MODEL}")
+        logger.info(f"CHATBOT_API_URL: {CHATBOT_API_URL or 'not set (in-process agent)'}")
+        logger.info(f"MAX_HISTORY_MESSAGES: {MAX_HISTORY_MESSAGES}")
+        logger.info(f"MAX_CHAT_THREADS: {MAX_CHAT_THREADS}")
+        logger.info(f"CHAT_THREAD_TTL_SECONDS: {CHAT_THREAD_TTL_SECONDS}")
         logger.info("Config initialized successfully")
     except Exception as e:
         logger.error(f"Error initializing Config class: {str(e)}")
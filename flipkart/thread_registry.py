@@ -0,0 +1,71 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any
+
+from utils.logger import get_logger
+from utils.custom_exception import CustomException
+
+
+logger = get_logger(__name__)
+
+
+class ThreadRegistry:
+    """
+    Tracks per-client LangGraph memory threads and evicts them from the
+    checkpointer once they expire or the registry exceeds its size (LRU).
+    """
+
+    def __init__(
+        self,
+        checkpointer: Any,
+        max_threads: int = 1000,
+        ttl_seconds: float = 3600,
+    ) -> None:
+        try:
+            logger.info(f"Initializing ThreadRegistry: max_threads={max_threads}, ttl_seconds={ttl_seconds}")
+            self.checkpointer = checkpointer
+            self.max_threads = max_threads
+            self.ttl_seconds = ttl_seconds
+            self._last_seen: "OrderedDict[str, float]" = OrderedDict()
+            self._lock = threading.Lock()
+            logger.info("ThreadRegistry initialized successfully")
+        except Exception as e:
+            logger.error(f"Error initializing ThreadRegistry: {str(e)}")
+            raise CustomException("Failed to initialize ThreadRegistry", e)
+
+    @staticmethod
+    def is_valid(thread_id: str) -> bool:
+        try:
+            uuid.UUID(thread_id)
+            return True
+        except (TypeError, ValueError, AttributeError):
+            return False
+
+    def touch(self, thread_id: str) -> None:
+        try:
+            now = time.monotonic()
+            with self._lock:
+                self._last_seen[thread_id] = now
+                self._last_seen.move_to_end(thread_id)
+
+                # Oldest entries sit at the front, so evict from there
+                expired = []
+                while self._last_seen:
+                    oldest_tid, oldest_seen = next(iter(self._last_seen.items()))
+                    if (
+                        len(self._last_seen) <= self.max_threads
+                        and now - oldest_seen <= self.ttl_seconds
+                    ):
+                        break
+                    self._last_seen.popitem(last=False)
+                    expired.append(oldest_tid)
+
+            for tid in expired:
+                self.checkpointer.delete_thread(tid)
+            if expired:
+                logger.info(f"Evicted {len(expired)} chat threads, {len(self._last_seen)} active")
+        except Exception as e:
+            logger.error(f"Error updating ThreadRegistry: {str(e)}")
+            raise CustomException("Failed to update chat thread registry", e)
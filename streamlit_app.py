@@ -1,11 +1,13 @@
+import json
 import uuid
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
+import requests
 import streamlit as st
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
-from flipkart.data_ingestion import DataIngestor
-from flipkart.rag_agent import RAGAgentBuilder
+from flipkart.config import Config
 from utils.logger import get_logger
 from utils.custom_exception import CustomException
 
@@ -23,6 +25,11 @@ except Exception as e:
     raise CustomException("Failed to load environment variables in Streamlit", e)
 
 
+# Client mode: delegate inference to the Flask API instead of running the
+# agent inside the Streamlit process
+CLIENT_MODE: bool = bool(Config.CHATBOT_API_URL)
+
+
 # ---------------------------
 # Streamlit Page Config
 # ---------------------------
@@ -41,6 +48,9 @@ st.sidebar.caption(
     "Powered by LangChain, LangGraph and AstraDB vector search.\n"
     "Uses Retrieval-Augmented Generation (RAG) over real product reviews."
 )
+st.sidebar.caption(
+    f"Inference: {'remote API' if CLIENT_MODE else 'in-process agent'}"
+)
 
 
 try:
@@ -75,6 +85,10 @@ except Exception as e:
 @st.cache_resource(show_spinner="🔍 Loading product knowledge base...")
 def load_agent() -> Any:
     try:
+        # Imported lazily so client mode does not need the inference stack
+        from flipkart.data_ingestion import DataIngestor
+        from flipkart.rag_agent import RAGAgentBuilder
+
         logger.info("Loading vector store and RAG agent")
         vector_store = DataIngestor().ingest(load_existing=True)
         agent = RAGAgentBuilder(vector_store).build_agent()
@@ -85,7 +99,107 @@ def load_agent() -> Any:
         raise CustomException("Failed to load RAG agent in Streamlit", e)
 
 
-rag_agent = load_agent()
+# ---------------------------
+# Pooled HTTP Connections (Client Mode)
+# ---------------------------
+@st.cache_resource
+def get_api_adapter() -> HTTPAdapter:
+    try:
+        # The adapter's urllib3 pool is thread-safe and shared by all sessions
+        logger.info(
+            f"Creating pooled API adapter for {Config.CHATBOT_API_URL} "
+            f"(pool size {Config.CHATBOT_API_POOL_SIZE})"
+        )
+        adapter = HTTPAdapter(
+            pool_connections=Config.CHATBOT_API_POOL_SIZE,
+            pool_maxsize=Config.CHATBOT_API_POOL_SIZE,
+        )
+        logger.info("Pooled API adapter created successfully")
+        return adapter
+    except Exception as e:
+        logger.error(f"Error creating API adapter: {str(e)}")
+        raise CustomException("Failed to create chatbot API adapter", e)
+
+
+def get_api_session() -> requests.Session:
+    try:
+        # One requests.Session per browser session, mounting the shared pool
+        if "api_session" not in st.session_state:
+            session = requests.Session()
+            adapter = get_api_adapter()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            st.session_state.api_session = session
+            logger.info("API session created for browser session")
+        return st.session_state.api_session
+    except Exception as e:
+        logger.error(f"Error creating API session: {str(e)}")
+        raise CustomException("Failed to create chatbot API session", e)
+
+
+def stream_from_api(user_input: str, thread_id: str) -> Iterator[Dict[str, Any]]:
+    try:
+        logger.info(f"Streaming response from API for thread {thread_id}")
+        with get_api_session().post(
+            f"{Config.CHATBOT_API_URL.rstrip('/')}/stream",
+            json={"msg": user_input, "thread_id": thread_id},
+            stream=True,
+            timeout=Config.CHATBOT_API_TIMEOUT,
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines(decode_unicode=True):
+                if line:
+                    yield json.loads(line)
+        logger.info("API stream completed")
+    except Exception as e:
+        logger.error(f"Error streaming from chatbot API: {str(e)}")
+        raise CustomException("Failed to stream response from chatbot API", e)
+
+
+def append_message(role: str, content: str) -> None:
+    # Keep per-session history bounded so reruns replay a fixed-size window
+    st.session_state.messages.append({"role": role, "content": content})
+    if len(st.session_state.messages) > Config.MAX_HISTORY_MESSAGES:
+        st.session_state.messages = st.session_state.messages[
+            -Config.MAX_HISTORY_MESSAGES:
+        ]
+
+
+def generate_reply(user_input: str) -> str:
+    try:
+        with st.spinner("🤖 Thinking..."):
+            response: Dict[str, Any] = rag_agent.invoke(
+                {
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": user_input,
+                        }
+                    ]
+                },
+                config={
+                    "configurable": {
+                        "thread_id": st.session_state.thread_id,
+                    }
+                },
+            )
+
+        st.session_state.prediction_count += 1
+        logger.info("RAG prediction completed")
+
+        if not response.get("messages"):
+            logger.warning("Empty agent response")
+            return "Sorry, I couldn't find relevant product information."
+
+        reply: str = response["messages"][-1].content
+        logger.info(f"Response length: {len(reply)} chars")
+        return reply
+    except Exception as e:
+        logger.error(f"Error invoking in-process RAG agent: {str(e)}")
+        raise CustomException("Failed to generate reply from RAG agent", e)
+
+
+rag_agent = None if CLIENT_MODE else load_agent()
 
 
 # ---------------------------
@@ -108,6 +222,8 @@ st.write(
 # ---------------------------
 # Display Chat History
 # ---------------------------
+# Reruns replay at most MAX_HISTORY_MESSAGES messages; only the new turn
+# below is rendered incrementally
 try:
     for msg in st.session_state.messages:
         with st.chat_message(msg["role"]):
@@ -128,63 +244,47 @@ user_input = user_input_raw.strip() if user_input_raw is not None else ""
 
 
 if user_input:
+    reply: str = ""
     try:
         logger.info(f"Processing user input: {user_input[:50]}...")
         st.session_state.request_count += 1
 
         # Show user message
-        st.session_state.messages.append(
-            {
-                "role": "user",
-                "content": user_input,
-            }
-        )
+        append_message("user", user_input)
 
         with st.chat_message("user"):
             st.markdown(user_input)
 
         # Assistant Response
         with st.chat_message("assistant"):
-            with st.spinner("🤖 Thinking..."):
-                response: Dict[str, Any] = rag_agent.invoke(
-                    {
-                        "messages": [
-                            {
-                                "role": "user",
-                                "content": user_input,
-                            }
-                        ]
-                    },
-                    config={
-                        "configurable": {
-                            "thread_id": st.session_state.thread_id,
-                        }
-                    },
-                )
-
-            st.session_state.prediction_count += 1
-            logger.info("RAG prediction completed")
-
-            if not response.get("messages"):
-                reply: str = (
-                    "Sorry, I couldn't find relevant product information."
-                )
-                logger.warning("Empty agent response")
+            if CLIENT_MODE:
+                # Render the new turn incrementally as tokens arrive; a reset
+                # event drops text from a model step that called a tool
+                placeholder = st.empty()
+                for event in stream_from_api(user_input, st.session_state.thread_id):
+                    if event.get("reset"):
+                        reply = ""
+                    else:
+                        reply += event.get("delta", "")
+                    placeholder.markdown(reply + "▌")
+                placeholder.markdown(reply)
+                st.session_state.prediction_count += 1
+                logger.info(f"Streamed response length: {len(reply)} chars")
             else:
-                reply = response["messages"][-1].content
-                logger.info(f"Response length: {len(reply)} chars")
-
-            st.markdown(reply)
+                reply = generate_reply(user_input)
+                st.markdown(reply)
 
-        st.session_state.messages.append(
-            {
-                "role": "assistant",
-                "content": reply,
-            }
-        )
+        append_message("assistant", reply)
         logger.info("Chat message saved to session")
     except Exception as e:
         logger.error(f"Error processing user query: {str(e)}")
+        # Record the assistant turn anyway so history never ends on an
+        # unanswered user message
+        append_message(
+            "assistant",
+            f"{reply}\n\n_(Response interrupted)_" if reply
+            else "Sorry, something went wrong processing your query.",
+        )
         st.error("Sorry, something went wrong processing your query")
         raise CustomException("Streamlit RAG processing failed", e)
 